@@ -19,61 +19,62 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
-# In-memory activity database
+# In-memory activity database. Participants are dicts used as ordered sets:
+# O(1) membership checks while keeping signup order.
 activities = {
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": dict.fromkeys(["michael@mergington.edu", "daniel@mergington.edu"])
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": dict.fromkeys(["emma@mergington.edu", "sophia@mergington.edu"])
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": dict.fromkeys(["john@mergington.edu", "olivia@mergington.edu"])
     },
     "Soccer Team": {
         "description": "Team training, matches, and seasonal tournaments",
         "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
         "max_participants": 25,
-        "participants": ["liam@mergington.edu", "noah@mergington.edu"]
+        "participants": dict.fromkeys(["liam@mergington.edu", "noah@mergington.edu"])
     },
     "Basketball Team": {
         "description": "Practice drills, scrimmages, and inter-school games",
         "schedule": "Mondays, Wednesdays, Fridays, 4:00 PM - 6:00 PM",
         "max_participants": 15,
-        "participants": ["ava@mergington.edu", "isabella@mergington.edu"]
+        "participants": dict.fromkeys(["ava@mergington.edu", "isabella@mergington.edu"])
     },
     "Art Club": {
         "description": "Explore drawing, painting, and mixed media projects",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["mia@mergington.edu", "charlotte@mergington.edu"]
+        "participants": dict.fromkeys(["mia@mergington.edu", "charlotte@mergington.edu"])
     },
     "Drama Club": {
         "description": "Acting workshops, production rehearsals, and performances",
         "schedule": "Tuesdays and Thursdays, 5:00 PM - 7:00 PM",
         "max_participants": 20,
-        "participants": ["amelia@mergington.edu", "harper@mergington.edu"]
+        "participants": dict.fromkeys(["amelia@mergington.edu", "harper@mergington.edu"])
     },
     "Science Club": {
         "description": "Hands-on experiments, science fairs, and guest lectures",
         "schedule": "Fridays, 4:00 PM - 5:30 PM",
         "max_participants": 20,
-        "participants": ["evelyn@mergington.edu", "jack@mergington.edu"]
+        "participants": dict.fromkeys(["evelyn@mergington.edu", "jack@mergington.edu"])
     },
     "Debate Team": {
         "description": "Prepare arguments, practice public speaking, and compete in debates",
         "schedule": "Tuesdays and Thursdays, 6:00 PM - 7:30 PM",
         "max_participants": 16,
-        "participants": ["sophia.r@mergington.edu", "mason@mergington.edu"]
+        "participants": dict.fromkeys(["sophia.r@mergington.edu", "mason@mergington.edu"])
     }
 }
 
@@ -85,7 +86,11 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Expose participants as lists, in signup order
+    return {
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -105,7 +110,7 @@ def signup_for_activity(activity_name: str, email: str):
     # Validate activity is not full
     if len(activity["participants"]) >= activity["max_participants"]:
         raise HTTPException(status_code=400, detail="Activity is full")
-    activity["participants"].append(email)
+    activity["participants"][email] = None
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -124,5 +129,5 @@ def unregister_from_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student is not signed up for this activity")
     
     # Remove student from the activity
-    activity["participants"].remove(email)
+    del activity["participants"][email]
     return {"message": f"Unregistered {email} from {activity_name}"}
@@ -1,90 +1,104 @@
 """
 Test configuration and fixtures for FastAPI tests
 """
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 import sys
 import os
+from pathlib import Path
+from types import MappingProxyType
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from app import app, activities
+import app as app_module
+from app import app
+
+
+# Initial activities data, loaded once at import and copied on each reset.
+# The outer mapping and every entry are read-only proxies and participants
+# are tuples, so the template itself can never be mutated by accident.
+_ORIGINAL_ACTIVITIES = MappingProxyType({
+    name: MappingProxyType({**entry, "participants": tuple(entry["participants"])})
+    for name, entry in orjson.loads(
+        (Path(__file__).parent / "fixtures" / "activities.json").read_bytes()
+    ).items()
+})
+
+
+# Filler emails for padding activities up to capacity, enough for the largest
+_PAD_EMAILS = tuple(
+    f"pad{i}@mergington.edu"
+    for i in range(max(a["max_participants"] for a in _ORIGINAL_ACTIVITIES.values()))
+)
+
+
+def _clone_activities():
+    """Copy the template, giving each activity its own participants dict"""
+    # Only participants is mutated by the API; other values are immutable
+    return {
+        name: {**entry, "participants": dict.fromkeys(entry["participants"])}
+        for name, entry in _ORIGINAL_ACTIVITIES.items()
+    }
+
+
+@pytest.fixture(scope="session", autouse=True)
+def seed_activities():
+    """Seed the shared activities data from the template once per session"""
+    app_module.activities.clear()
+    app_module.activities.update(_clone_activities())
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Pin the anyio backend once for the whole session"""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def client(anyio_backend):
+    """Create a single test client for the FastAPI app, shared by the session"""
+    with TestClient(app, backend=anyio_backend) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def activities_snapshot(client):
+    """Fetch and parse the pristine /activities response once per session"""
+    response = client.get("/activities")
+    assert response.status_code == 200
+    return response.json()
 
 
 @pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+def reset_activities(monkeypatch):
+    """Give each test its own copy of the activities data
+
+    The route handlers look up ``app.activities`` at call time, so swapping
+    in a fresh copy isolates the test without touching the shared data;
+    monkeypatch puts the original back on teardown. Only tests that mutate
+    activities need this fixture, so read-only tests can skip it and still
+    see the initial state regardless of the order tests run in.
+    """
+    monkeypatch.setattr(app_module, "activities", _clone_activities())
 
 
 @pytest.fixture
-def reset_activities():
-    """Reset activities data to initial state before each test"""
-    # Store original activities
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Soccer Team": {
-            "description": "Team training, matches, and seasonal tournaments",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
-            "max_participants": 25,
-            "participants": ["liam@mergington.edu", "noah@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Practice drills, scrimmages, and inter-school games",
-            "schedule": "Mondays, Wednesdays, Fridays, 4:00 PM - 6:00 PM",
-            "max_participants": 15,
-            "participants": ["ava@mergington.edu", "isabella@mergington.edu"]
-        },
-        "Art Club": {
-            "description": "Explore drawing, painting, and mixed media projects",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["mia@mergington.edu", "charlotte@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Acting workshops, production rehearsals, and performances",
-            "schedule": "Tuesdays and Thursdays, 5:00 PM - 7:00 PM",
-            "max_participants": 20,
-            "participants": ["amelia@mergington.edu", "harper@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Hands-on experiments, science fairs, and guest lectures",
-            "schedule": "Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": ["evelyn@mergington.edu", "jack@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Prepare arguments, practice public speaking, and compete in debates",
-            "schedule": "Tuesdays and Thursdays, 6:00 PM - 7:30 PM",
-            "max_participants": 16,
-            "participants": ["sophia.r@mergington.edu", "mason@mergington.edu"]
-        }
-    }
-    
-    # Reset activities to original state
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Clean up after test (reset again)
-    activities.clear()
-    activities.update(original_activities)
\ No newline at end of file
+def filled_activity(request, reset_activities):
+    """Fill the activity named by the test parameter to one below capacity"""
+    name = request.param
+    activity = app_module.activities[name]
+    needed = activity["max_participants"] - len(activity["participants"]) - 1
+    assert 0 <= needed <= len(_PAD_EMAILS), f"cannot pad {name} with {needed} participants"
+    # Pad directly rather than via concurrent signups: the handlers are sync
+    # and run in a threadpool, so parallel requests would race on the
+    # capacity check
+    activity["participants"].update(dict.fromkeys(_PAD_EMAILS[:needed]))
+    return name
+
+
+def pytest_collection_modifyitems(items):
+    """Run read-only tests first and group the mutating ones after them"""
+    # sort is stable, so file order is kept within each group
+    items.sort(key=lambda item: "reset_activities" in getattr(item, "fixturenames", ()))
@@ -5,18 +5,25 @@ import pytest
 from fastapi.testclient import TestClient
 
 
+# Expected shape of each activity returned by /activities
+_KEY_TYPES = {
+    "description": str,
+    "schedule": str,
+    "max_participants": int,
+    "participants": list,
+}
+_REQUIRED_KEYS = frozenset(_KEY_TYPES)
+
+
 def test_root_redirect(client):
     """Test that root path redirects to static/index.html"""
     response = client.get("/")
     assert response.status_code == 200
 
 
-def test_get_activities(client, reset_activities):
+def test_get_activities(activities_snapshot):
     """Test getting all activities"""
-    response = client.get("/activities")
-    assert response.status_code == 200
-    
-    data = response.json()
+    data = activities_snapshot
     assert isinstance(data, dict)
     assert "Chess Club" in data
     assert "Programming Class" in data
@@ -46,42 +53,50 @@ def test_signup_for_activity_success(client, reset_activities):
     activities_response = client.get("/activities")
     activities = activities_response.json()
     assert "test@mergington.edu" in activities["Chess Club"]["participants"]
-
-
-def test_signup_for_nonexistent_activity(client, reset_activities):
-    """Test signup for non-existent activity"""
-    response = client.post(
-        "/activities/Nonexistent Club/signup?email=test@mergington.edu"
-    )
-    assert response.status_code == 404
+    # Participants are returned in signup order
+    assert activities["Chess Club"]["participants"][-1] == "test@mergington.edu"
+
+
+@pytest.mark.parametrize(
+    "method,url,status,detail",
+    [
+        ("post", "/activities/Nonexistent Club/signup?email=test@mergington.edu",
+         404, "Activity not found"),
+        ("delete", "/activities/Nonexistent Club/unregister?email=test@mergington.edu",
+         404, "Activity not found"),
+        ("post", "/activities/Chess Club/signup?email=michael@mergington.edu",
+         400, "Student is already signed up"),
+        ("delete", "/activities/Chess Club/unregister?email=notregistered@mergington.edu",
+         400, "Student is not signed up for this activity"),
+    ],
+    ids=[
+        "signup_nonexistent_activity",
+        "unregister_nonexistent_activity",
+        "signup_duplicate_participant",
+        "unregister_non_participant",
+    ],
+)
+def test_error_paths(client, reset_activities, method, url, status, detail):
+    """Test error responses for unknown activities and invalid participants"""
+    response = client.request(method, url)
+    assert response.status_code == status
     
     data = response.json()
-    assert data["detail"] == "Activity not found"
+    assert data["detail"] == detail
 
 
-def test_signup_duplicate_participant(client, reset_activities):
-    """Test signup when participant is already registered"""
+@pytest.mark.parametrize("filled_activity", ["Chess Club"], indirect=True)
+def test_signup_activity_full(client, filled_activity):
+    """Test signup when activity is full"""
+    # Chess Club is pre-filled to one below its limit; take the last spot
     response = client.post(
-        "/activities/Chess Club/signup?email=michael@mergington.edu"
+        f"/activities/{filled_activity}/signup?email=last@mergington.edu"
     )
-    assert response.status_code == 400
-    
-    data = response.json()
-    assert data["detail"] == "Student is already signed up"
-
+    assert response.status_code == 200
 
-def test_signup_activity_full(client, reset_activities):
-    """Test signup when activity is full"""
-    # First, fill up the Chess Club (max 12 participants, currently has 2)
-    for i in range(10):  # Add 10 more to reach 12
-        response = client.post(
-            f"/activities/Chess Club/signup?email=test{i}@mergington.edu"
-        )
-        assert response.status_code == 200
-    
     # Now try to add one more (should fail)
     response = client.post(
-        "/activities/Chess Club/signup?email=overflow@mergington.edu"
+        f"/activities/{filled_activity}/signup?email=overflow@mergington.edu"
     )
     assert response.status_code == 400
     
@@ -107,44 +122,15 @@ def test_unregister_from_activity_success(client, reset_activities):
     assert "michael@mergington.edu" not in activities["Chess Club"]["participants"]
 
 
-def test_unregister_from_nonexistent_activity(client, reset_activities):
-    """Test unregistration from non-existent activity"""
-    response = client.delete(
-        "/activities/Nonexistent Club/unregister?email=test@mergington.edu"
-    )
-    assert response.status_code == 404
-    
-    data = response.json()
-    assert data["detail"] == "Activity not found"
-
-
-def test_unregister_non_participant(client, reset_activities):
-    """Test unregistration when participant is not registered"""
-    response = client.delete(
-        "/activities/Chess Club/unregister?email=notregistered@mergington.edu"
-    )
-    assert response.status_code == 400
-    
-    data = response.json()
-    assert data["detail"] == "Student is not signed up for this activity"
-
-
-def test_activities_data_structure(client, reset_activities):
+def test_activities_data_structure(activities_snapshot):
     """Test that activities have the correct data structure"""
-    response = client.get("/activities")
-    activities = response.json()
+    activities = activities_snapshot
     
     for activity_name, activity_data in activities.items():
         assert isinstance(activity_name, str)
-        assert "description" in activity_data
-        assert "schedule" in activity_data
-        assert "max_participants" in activity_data
-        assert "participants" in activity_data
-        
-        assert isinstance(activity_data["description"], str)
-        assert isinstance(activity_data["schedule"], str)
-        assert isinstance(activity_data["max_participants"], int)
-        assert isinstance(activity_data["participants"], list)
+        assert _REQUIRED_KEYS <= activity_data.keys()
+        for key, expected in _KEY_TYPES.items():
+            assert isinstance(activity_data[key], expected), key
         
         # Check that participants list doesn't exceed max_participants
         assert len(activity_data["participants"]) <= activity_data["max_participants"]
@@ -172,26 +158,23 @@ def test_email_encoding_in_urls(client, reset_activities):
     assert response.status_code == 200
 
 
-def test_activity_participant_count_limits(client, reset_activities):
+@pytest.mark.parametrize("filled_activity", ["Basketball Team"], indirect=True)
+def test_activity_participant_count_limits(client, filled_activity):
     """Test that participant counts are enforced correctly"""
-    # Test with Basketball Team (max 15, currently has 2)
-    initial_count = len(client.get("/activities").json()["Basketball Team"]["participants"])
-    max_participants = client.get("/activities").json()["Basketball Team"]["max_participants"]
-    
-    # Add participants up to the limit
-    for i in range(max_participants - initial_count):
-        response = client.post(
-            f"/activities/Basketball Team/signup?email=player{i}@mergington.edu"
-        )
-        assert response.status_code == 200
+    # Basketball Team is pre-filled to one below its limit; add the last participant
+    response = client.post(
+        f"/activities/{filled_activity}/signup?email=player@mergington.edu"
+    )
+    assert response.status_code == 200
     
-    # Verify we're at the limit
-    activities = client.get("/activities").json()
-    assert len(activities["Basketball Team"]["participants"]) == max_participants
+    # Verify we're at the limit, reading count and limit from a single GET
+    snapshot = client.get("/activities").json()[filled_activity]
+    max_participants = snapshot["max_participants"]
+    assert len(snapshot["participants"]) == max_participants
     
     # Try to add one more (should fail)
     response = client.post(
-        "/activities/Basketball Team/signup?email=overflow@mergington.edu"
+        f"/activities/{filled_activity}/signup?email=overflow@mergington.edu"
     )
     assert response.status_code == 400
     assert response.json()["detail"] == "Activity is full"
\ No newline at end of file